@@ -10,18 +10,130 @@ bl_info = {
 
 import bpy
 import bmesh
+import functools
 import math
 import time
+import traceback
+import numpy as np
+from mathutils import Vector
 from bpy.types import Operator, Panel, PropertyGroup
-from bpy.props import IntProperty, BoolProperty, FloatVectorProperty, FloatProperty, CollectionProperty, StringProperty
+from bpy.props import IntProperty, BoolProperty, FloatVectorProperty, FloatProperty, StringProperty
 
 # =====================================================
 # VERTEX POSITION STORAGE
 # =====================================================
 
-class VertexPos(PropertyGroup):
-    """Store vertex position for comparison"""
-    co: FloatVectorProperty(size=3)
+# The chapter-4 vertex snapshot lives in a single BYTE_STRING property
+# (raw float32 triplets, 12 B/vertex) instead of a CollectionProperty of
+# per-vertex PropertyGroups, so the .blend writer emits one blob rather
+# than thousands of RNA id-properties. This module-level cache holds the
+# decoded (N, 3) array and is rebuilt lazily after an addon reload.
+_initial_co_cache = None
+
+# Resolved VIEW_3D space per screen, keyed by Screen.as_pointer().
+# Validated on every hit and cleared on file load, so the cache cannot
+# outlive a layout change.
+_view3d_space_cache = {}
+
+# Per-node-tree scan results, keyed by NodeTree.as_pointer(). Entries
+# store (node_count, link_count, bsdf, image_texture, link_index) and
+# are re-scanned whenever either count changes. link_index is a set of
+# (from_ptr, from_socket, to_ptr, to_socket) tuples for O(1) link tests.
+_node_scan_cache = {}
+
+# Edit-mode bmesh wrapper per mesh, keyed by Mesh.as_pointer().
+# Re-validated with bm.is_valid on every hit, so a bmesh freed by
+# leaving edit mode is never handed out.
+_edit_bm_cache = {}
+
+# =====================================================
+# STAGE DATA
+# =====================================================
+
+# Static lookup tables built once at import; get_stage_info used to
+# rebuild these dicts on every call from the timer/draw path.
+_STAGE_INFO = {
+    1: {
+        1: {"title": "第1章: 基本操作", "name": "ステージ1: キューブを選択",
+            "description": "キューブを選択してください", "control": "", "manual": False},
+        2: {"title": "第1章: 基本操作", "name": "ステージ2: キューブを移動",
+            "description": "X軸方向に+2移動", "control": "", "manual": False},
+        3: {"title": "第1章: 基本操作", "name": "ス���ージ3: キューブを回転",
+            "description": "X軸周りに45度回転", "control": "", "manual": False},
+        4: {"title": "第1章: 基本操作", "name": "ステージ4: スケール変更",
+            "description": "サイズを変更", "control": "", "manual": False},
+    },
+    2: {
+        1: {"title": "第2章: ビュー操作", "name": "ステージ1: ビューを移動",
+            "description": "Shift + 中ボタンでパン", "control": "Shift + 中ボタンドラッグ", "manual": False},
+        2: {"title": "第2章: ビュー操作", "name": "ステージ2: ズーム",
+            "description": "中ボタンスクロール", "control": "中ボタンスクロール", "manual": False},
+        3: {"title": "第2章: ビュー操作", "name": "ステージ3: ビュー回転",
+            "description": "中ボタンドラッグ", "control": "中ボタンドラッグ", "manual": False},
+        4: {"title": "第2章: ビュー操作", "name": "ステージ4: すべてマスター",
+            "description": "すべての操作を実行", "control": "すべてのビュー操作", "manual": False},
+    },
+    3: {
+        1: {"title": "第3章: モデリング基礎", "name": "ステージ1: エディットモード",
+            "description": "Tab キーで切り替え", "control": "Tab キー", "manual": False},
+        2: {"title": "第3章: モデリング基礎", "name": "ステージ2: 頂点選択",
+            "description": "3個以上の頂点を選択", "control": "1 キー", "manual": False},
+        3: {"title": "第3章: モデリング基礎", "name": "ステージ3: エッジ選択",
+            "description": "エッジを選択", "control": "2 キー", "manual": False},
+        4: {"title": "第3章: モデリング基礎", "name": "ステージ4: フェース選択",
+            "description": "フェースを選択", "control": "3 キー", "manual": False},
+        5: {"title": "第3章: モデリング基礎", "name": "ステージ5: エクストルード",
+            "description": "E キーで押し出し", "control": "E キー", "manual": False},
+        6: {"title": "第3章: モデリング基礎", "name": "ステージ6: ループカット",
+            "description": "Ctrl+R でループカット", "control": "Ctrl+R", "manual": False},
+    },
+    4: {
+        1: {"title": "第4章: スカルプティング体験", "name": "ステージ1: スカルプトモード",
+            "description": "Sculpt Mode に入ってください", "control": "", "manual": False},
+        2: {"title": "第4章: スカルプティング体験", "name": "ステージ2: Draw ブラシを使う",
+            "description": "Draw ブラシで球の表面を変形", "control": "Draw ブラシでドラッグ", "manual": False,
+            "tip": "💡 ヒント: 自由に実験してみよう!"},
+        3: {"title": "第4章: スカルプティング体験", "name": "ステージ3: Smooth ブラシに切り替え",
+            "description": "Smooth ブラシを選択してください", "control": "Smooth ブラシを選択", "manual": False,
+            "tip": "💡 ヒント: 自由に実験してみよう!"},
+        4: {"title": "第4章: スカルプティング体験", "name": "ステージ4: Grab ブラシに切り替え",
+            "description": "Grab ブラシを選択してください", "control": "Grab ブラシを選択", "manual": False,
+            "tip": "💡 ヒント: 自由に実験してみよう!"},
+    },
+    5: {
+        1: {"title": "第5章: マテリアルノード", "name": "🟢 ステージ1: マテリアル作成",
+            "description": "「新規」ボタンを押す",
+            "details": "上部メニューの 「シェーディング」 を選択し,\n表示されたタブの 「新規」 ボタンを押してマテリアルを作成しよう!",
+            "control": "", "manual": False},
+        2: {"title": "第5章: マテリアルノード", "name": "🟢 ステージ2: 色変更",
+            "description": "Base Color を変更",
+            "details": "「プリンシプルBSDF」ノードの\nベースカラー を変更して,オブジェクトの色を変えてみよう!",
+            "control": "", "manual": False},
+        3: {"title": "第5章: マテリアルノード", "name": "🟢 ステージ3: 画像テクスチャ追加",
+            "description": "追加 → 画像テクスチャで画像読み込み",
+            "details": "メニューから\n\n追加 → テクスチャ → 画像テクスチャ\n\nを選択し,好きな画像を読み込んでみよう!",
+            "control": "", "manual": False},
+        4: {"title": "第5章: マテリアルノード", "name": "🟢 ステージ4: ノード接続",
+            "description": "ImageTexture → BaseColor に接続",
+            "details": "ImageTexture ノードの Color 出力を\nPrincipled BSDF のベースカラー入力に接続してみよう!",
+            "control": "", "manual": False},
+        5: {"title": "第5章: マテリアルノード", "name": "🟢 ステージ5: 質感調整",
+            "description": "Roughness または Metallic を変更",
+            "details": "Principled BSDF の\nラフネス または メタリック を変更して,\nリアルな素材の見た目を作ってみよう!",
+            "control": "", "manual": False},
+    },
+}
+
+# Hoisted from the panel draw and next-stage operator, which each
+# rebuilt this table per call. A tuple indexed by chapter number
+# (slot 0 unused) keeps lookups allocation-free.
+_MAX_STAGES = (0, 4, 4, 6, 4, 5)
+
+@functools.lru_cache(maxsize=32)
+def _stage_details_lines(chapter_num, stage_num):
+    """Pre-split 'details' lines so the panel doesn't re-split per redraw"""
+    details = _STAGE_INFO.get(chapter_num, {}).get(stage_num, {}).get('details', '')
+    return tuple(details.split('\n')) if details else ()
 
 # =====================================================
 # STAGE VALIDATION & UTILITIES
@@ -52,31 +164,18 @@ class StageManager:
                 print("❌ VIEW_3D not found")
                 return False
             
-            # Save area list before split
-            old_areas = set(context.screen.areas)
-            
-            # Split area
-            override = {
-                "window": context.window,
-                "screen": context.screen,
-                "area": view_area,
-                "region": view_area.regions[-1],
-            }
-            
-            bpy.ops.screen.area_split(
-                override,
-                direction='HORIZONTAL',
-                factor=0.7
-            )
-            
-            # Get new area by comparing with old list
-            new_area = None
-            for area in context.screen.areas:
-                if area not in old_areas:
-                    new_area = area
-                    break
-            
-            if not new_area:
+            # Split area (area_split appends the new area to
+            # screen.areas, so no before/after set diff is needed)
+            with context.temp_override(
+                window=context.window,
+                screen=context.screen,
+                area=view_area,
+                region=view_area.regions[-1],
+            ):
+                bpy.ops.screen.area_split(direction='HORIZONTAL', factor=0.7)
+
+            new_area = context.screen.areas[-1]
+            if new_area is view_area:
                 print("❌ New area not found")
                 return False
             
@@ -87,14 +186,14 @@ class StageManager:
             # Focus on new area
             for region in new_area.regions:
                 if region.type == 'WINDOW':
-                    override = {
-                        'window': context.window,
-                        'screen': context.screen,
-                        'area': new_area,
-                        'region': region
-                    }
-                    bpy.ops.screen.screen_full_area(override)
-                    bpy.ops.screen.back_to_previous(override)
+                    with context.temp_override(
+                        window=context.window,
+                        screen=context.screen,
+                        area=new_area,
+                        region=region,
+                    ):
+                        bpy.ops.screen.screen_full_area()
+                        bpy.ops.screen.back_to_previous()
                     break
             
             print("✓ Shader Editor を下部に表示し、フォーカスしました")
@@ -102,63 +201,112 @@ class StageManager:
         
         except Exception as e:
             print(f"Error opening shader editor: {e}")
-            import traceback
             traceback.print_exc()
             return False
     
+    @staticmethod
+    def _find_mesh_by_name(name):
+        """Find a mesh object by exact name (O(1)), falling back to a prefix scan"""
+        obj = bpy.data.objects.get(name)
+        if obj and obj.type == 'MESH':
+            return obj
+        for obj in bpy.data.objects:
+            if obj.type == 'MESH' and obj.name.startswith(name):
+                return obj
+        return None
+
     @staticmethod
     def find_cube():
         """Find the cube in the scene"""
-        try:
-            for obj in bpy.data.objects:
-                if obj.type == 'MESH' and "Cube" in obj.name:
-                    return obj
-        except Exception as e:
-            print(f"Error finding cube: {e}")
-        return None
-    
+        return StageManager._find_mesh_by_name("Cube")
+
     @staticmethod
     def find_sphere():
         """Find UV Sphere for sculpting"""
-        try:
-            for obj in bpy.data.objects:
-                if obj.type == 'MESH' and "Sphere" in obj.name:
-                    return obj
-        except Exception as e:
-            print(f"Error finding sphere: {e}")
-        return None
+        return StageManager._find_mesh_by_name("Sphere")
     
     @staticmethod
     def get_bm(obj):
-        """Get bmesh from object in edit mode"""
+        """Get bmesh from object in edit mode (cached between ticks)"""
         try:
             if not obj or obj.type != 'MESH':
                 return None
             if bpy.context.mode != 'EDIT_MESH':
                 return None
-            return bmesh.from_edit_mesh(obj.data)
+
+            key = obj.data.as_pointer()
+            bm = _edit_bm_cache.get(key)
+            if bm is not None and bm.is_valid:
+                return bm
+
+            bm = bmesh.from_edit_mesh(obj.data)
+            _edit_bm_cache[key] = bm
+            return bm
         except Exception as e:
             print(f"Error getting bmesh: {e}")
             return None
     
     @staticmethod
-    def get_mesh_element_count(obj):
-        """Get mesh element counts"""
+    def clear_scene_objects():
+        """Remove every object through the data API
+
+        bpy.data.objects.remove skips the operator pipeline entirely
+        (no select-all pass, no undo push per call), unlike the old
+        select_all + object.delete sweep.
+        """
         try:
-            if obj and obj.type == 'MESH' and obj.data:
-                return len(obj.data.vertices), len(obj.data.edges), len(obj.data.polygons)
+            for obj in list(bpy.data.objects):
+                bpy.data.objects.remove(obj, do_unlink=True)
         except Exception as e:
-            print(f"Error getting mesh element count: {e}")
+            print(f"Error clearing scene: {e}")
+
+    @staticmethod
+    def enter_edit_and_snapshot(cube, props):
+        """Enter edit mode on the cube, clear selection and record counts
+
+        Shared by the chapter-3 setup paths, which used to duplicate
+        this block verbatim for stage 6.
+        """
+        bpy.context.view_layer.objects.active = cube
+        cube.select_set(True)
+
+        bpy.ops.object.mode_set(mode='EDIT')
+
+        # Single C call instead of three Python loops over
+        # every element plus an edit-mesh update
+        bpy.ops.mesh.select_all(action='DESELECT')
+
+        verts, edges, faces = StageManager.get_mesh_element_count(cube)
+        props.initial_vertex_count = verts
+        props.initial_edge_count = edges
+        props.initial_face_count = faces
+
+    @staticmethod
+    def get_mesh_element_count(obj):
+        """Get mesh element counts"""
+        if obj and obj.type == 'MESH' and obj.data:
+            return len(obj.data.vertices), len(obj.data.edges), len(obj.data.polygons)
         return 0, 0, 0
     
     @staticmethod
     def get_view3d_space(context):
         """Get the VIEW_3D space"""
         try:
+            key = context.screen.as_pointer()
+            space = _view3d_space_cache.get(key)
+            if space is not None:
+                try:
+                    if space.type == 'VIEW_3D':
+                        return space
+                except ReferenceError:
+                    pass
+                del _view3d_space_cache[key]
+
             for area in context.screen.areas:
                 if area.type == 'VIEW_3D':
                     for space in area.spaces:
                         if space.type == 'VIEW_3D':
+                            _view3d_space_cache[key] = space
                             return space
         except Exception as e:
             print(f"Error getting VIEW_3D space: {e}")
@@ -167,31 +315,18 @@ class StageManager:
     @staticmethod
     def calculate_vertex_distance(v_co, init_co):
         """Calculate distance between two vertex positions"""
-        try:
-            dx = v_co[0] - init_co[0]
-            dy = v_co[1] - init_co[1]
-            dz = v_co[2] - init_co[2]
-            return (dx*dx + dy*dy + dz*dz) ** 0.5
-        except Exception as e:
-            print(f"Error calculating vertex distance: {e}")
-            return 0.0
+        return math.dist(v_co, init_co)
     
     @staticmethod
     def is_in_sculpt_mode():
         """Check if currently in sculpt mode"""
-        try:
-            return bpy.context.mode == 'SCULPT'
-        except:
-            return False
-    
+        return bpy.context.mode == 'SCULPT'
+
     @staticmethod
     def is_undo_running():
         """Check if Undo is currently running"""
-        try:
-            return bpy.context.window_manager.undo_depth > 0
-        except:
-            return False
-    
+        return bpy.context.window_manager.undo_depth > 0
+
     @staticmethod
     def get_current_brush_name():
         """Get the name of the currently selected brush"""
@@ -200,57 +335,70 @@ class StageManager:
                 brush = bpy.context.tool_settings.sculpt.brush
                 if brush:
                     return brush.name
-        except Exception as e:
-            print(f"Error getting brush name: {e}")
+        except (AttributeError, ReferenceError):
+            pass
         return None
     
     @staticmethod
-    def is_brush_type_selected(brush_type_name):
-        """Check if a specific brush type is currently selected"""
+    def is_brush_type_selected(sculpt_tool):
+        """Check if a sculpt tool (enum identifier, e.g. 'SMOOTH') is selected
+
+        Compares brush.sculpt_tool rather than the brush name, which is
+        both faster (enum token vs substring search) and immune to
+        localized brush names.
+        """
         try:
-            brush_name = StageManager.get_current_brush_name()
-            if brush_name:
-                return brush_type_name in brush_name
-        except Exception as e:
-            print(f"Error checking brush type: {e}")
-        return False
+            sculpt = bpy.context.tool_settings.sculpt
+            brush = sculpt.brush if sculpt else None
+            return brush is not None and brush.sculpt_tool == sculpt_tool
+        except (AttributeError, ReferenceError):
+            return False
     
     @staticmethod
-    def get_vertex_deformation_amount(sphere, initial_positions):
+    def clear_initial_positions_cache():
+        """Invalidate the cached vertex snapshot array"""
+        global _initial_co_cache
+        _initial_co_cache = None
+
+    @staticmethod
+    def get_initial_positions_array(blob):
+        """Decode the chapter-4 vertex snapshot blob to an (N, 3) float32 array"""
+        global _initial_co_cache
+        count = len(blob) // 12  # 3 * float32 per vertex
+        if _initial_co_cache is None or len(_initial_co_cache) != count:
+            _initial_co_cache = np.frombuffer(blob, dtype=np.float32).reshape(-1, 3)
+        return _initial_co_cache
+
+    @staticmethod
+    def get_vertex_deformation_amount(sphere, initial_positions_blob):
         """Calculate total deformation amount from initial state"""
         try:
             if not sphere or not sphere.data or not sphere.data.vertices:
                 return 0, 0.0
             
-            moved = 0
-            total_distance = 0.0
-            
             current_vert_count = len(sphere.data.vertices)
-            initial_vert_count = len(initial_positions)
-            
+            initial_vert_count = len(initial_positions_blob) // 12
+
             compare_count = min(current_vert_count, initial_vert_count)
-            
+
             if compare_count == 0:
                 return 0, 0.0
-            
-            for i in range(compare_count):
-                try:
-                    v = sphere.data.vertices[i]
-                    if not v or v.co is None:
-                        continue
-                    
-                    init_co = initial_positions[i].co
-                    if not init_co:
-                        continue
-                    
-                    dist = StageManager.calculate_vertex_distance(v.co, init_co)
-                    if dist > 0.001:
-                        moved += 1
-                        total_distance += dist
-                
-                except (IndexError, AttributeError, RuntimeError):
-                    continue
-            
+
+            # Pull all coordinates across the RNA boundary in one shot
+            # instead of touching each vertex from Python
+            cur = np.empty(current_vert_count * 3, dtype=np.float32)
+            sphere.data.vertices.foreach_get('co', cur)
+            cur = cur.reshape(-1, 3)[:compare_count]
+
+            init = StageManager.get_initial_positions_array(initial_positions_blob)[:compare_count]
+
+            diff = cur - init
+            dist_sq = np.einsum('ij,ij->i', diff, diff)
+            mask = dist_sq > 1e-6  # (0.001)^2
+
+            moved = int(mask.sum())
+            total_distance = float(np.sqrt(dist_sq[mask]).sum())
+
             return moved, total_distance
         
         except Exception as e:
@@ -268,42 +416,67 @@ class StageManager:
             if obj.active_material_index < 0:
                 return None
             return obj.active_material
-        except Exception as e:
-            print(f"Error getting material: {e}")
+        except (AttributeError, ReferenceError):
             return None
     
     @staticmethod
-    def get_principled_bsdf(material):
-        """Get the Principled BSDF node from a material"""
+    def scan_material_nodes(material):
+        """Find the Principled BSDF and Image Texture nodes in one pass
+
+        Cached per node tree and re-scanned whenever the node or link
+        count changes, so chapter-5 validation does not walk the tree
+        two or three times per tick.
+        """
         try:
             if not material or not material.use_nodes:
-                return None
-            
-            for node in material.node_tree.nodes:
+                return None, None
+
+            tree = material.node_tree
+            key = tree.as_pointer()
+            n_nodes = len(tree.nodes)
+            n_links = len(tree.links)
+
+            cached = _node_scan_cache.get(key)
+            if cached and cached[0] == n_nodes and cached[1] == n_links:
+                return cached[2], cached[3]
+
+            bsdf_node = None
+            image_texture_node = None
+            for node in tree.nodes:
                 if node.type == 'BSDF_PRINCIPLED':
-                    return node
-            return None
+                    bsdf_node = node
+                elif node.type == 'TEX_IMAGE':
+                    image_texture_node = node
+
+            link_index = {
+                (link.from_node.as_pointer(), link.from_socket.identifier,
+                 link.to_node.as_pointer(), link.to_socket.identifier)
+                for link in tree.links
+            }
+
+            _node_scan_cache[key] = (n_nodes, n_links, bsdf_node, image_texture_node, link_index)
+            return bsdf_node, image_texture_node
         except Exception as e:
-            print(f"Error getting Principled BSDF: {e}")
-            return None
-    
+            print(f"Error scanning material nodes: {e}")
+            return None, None
+
+    @staticmethod
+    def get_principled_bsdf(material):
+        """Get the Principled BSDF node from a material"""
+        bsdf, _ = StageManager.scan_material_nodes(material)
+        return bsdf
+
     @staticmethod
     def check_image_texture_node_exists(obj):
         """Check if an Image Texture node with loaded image exists"""
         try:
             mat = StageManager.get_active_material(obj)
-            if not mat or not mat.use_nodes:
-                return False
-            
-            for node in mat.node_tree.nodes:
-                if node.type == 'TEX_IMAGE':
-                    if node.image is not None:
-                        return True
-            return False
+            _, tex = StageManager.scan_material_nodes(mat)
+            return tex is not None and tex.image is not None
         except Exception as e:
             print(f"Error checking image texture: {e}")
             return False
-    
+
     @staticmethod
     def check_correct_node_link(obj):
         """Check if ImageTexture Color output is connected to Principled BSDF BaseColor input"""
@@ -311,29 +484,17 @@ class StageManager:
             mat = StageManager.get_active_material(obj)
             if not mat or not mat.use_nodes:
                 return False
-            
-            # Find Image Texture node
-            image_texture_node = None
-            bsdf_node = None
-            
-            for node in mat.node_tree.nodes:
-                if node.type == 'TEX_IMAGE':
-                    image_texture_node = node
-                if node.type == 'BSDF_PRINCIPLED':
-                    bsdf_node = node
-            
+
+            bsdf_node, image_texture_node = StageManager.scan_material_nodes(mat)
+
             if not image_texture_node or not bsdf_node:
                 return False
-            
-            # Check if there's a link from ImageTexture.Color to BSDF.BaseColor
-            for link in mat.node_tree.links:
-                # Check if link goes from ImageTexture output to BSDF input
-                if link.from_node == image_texture_node and link.to_node == bsdf_node:
-                    # Check if it's the Color output to BaseColor input
-                    if link.from_socket.name == 'Color' and link.to_socket.name == 'Base Color':
-                        return True
-            
-            return False
+
+            # O(1) membership test against the cached link index instead
+            # of walking every link
+            link_index = _node_scan_cache[mat.node_tree.as_pointer()][4]
+            return (image_texture_node.as_pointer(), 'Color',
+                    bsdf_node.as_pointer(), 'Base Color') in link_index
         except Exception as e:
             print(f"Error checking node link: {e}")
             return False
@@ -341,368 +502,344 @@ class StageManager:
     @staticmethod
     def get_stage_info(chapter_num, stage_num):
         """Get information about a stage"""
-        if chapter_num == 1:
-            stages = {
-                1: {"title": "第1章: 基本操作", "name": "ステージ1: キューブを選択", 
-                    "description": "キューブを選択してください", "control": "", "manual": False},
-                2: {"title": "第1章: 基本操作", "name": "ステージ2: キューブを移動", 
-                    "description": "X軸方向に+2移動", "control": "", "manual": False},
-                3: {"title": "第1章: 基本操作", "name": "ス���ージ3: キューブを回転", 
-                    "description": "X軸周りに45度回転", "control": "", "manual": False},
-                4: {"title": "第1章: 基本操作", "name": "ステージ4: スケール変更", 
-                    "description": "サイズを変更", "control": "", "manual": False},
-            }
-        elif chapter_num == 2:
-            stages = {
-                1: {"title": "第2章: ビュー操作", "name": "ステージ1: ビューを移動", 
-                    "description": "Shift + 中ボタンでパン", "control": "Shift + 中ボタンドラッグ", "manual": False},
-                2: {"title": "第2章: ビュー操作", "name": "ステージ2: ズーム", 
-                    "description": "中ボタンスクロール", "control": "中ボタンスクロール", "manual": False},
-                3: {"title": "第2章: ビュー操作", "name": "ステージ3: ビュー回転", 
-                    "description": "中ボタンドラッグ", "control": "中ボタンドラッグ", "manual": False},
-                4: {"title": "第2章: ビュー操作", "name": "ステージ4: すべてマスター", 
-                    "description": "すべての操作を実行", "control": "すべてのビュー操作", "manual": False},
-            }
-        elif chapter_num == 3:
-            stages = {
-                1: {"title": "第3章: モデリング基礎", "name": "ステージ1: エディットモード", 
-                    "description": "Tab キーで切り替え", "control": "Tab キー", "manual": False},
-                2: {"title": "第3章: モデリング基礎", "name": "ステージ2: 頂点選択", 
-                    "description": "3個以上の頂点を選択", "control": "1 キー", "manual": False},
-                3: {"title": "第3章: モデリング基礎", "name": "ステージ3: エッジ選択", 
-                    "description": "エッジを選択", "control": "2 キー", "manual": False},
-                4: {"title": "第3章: モデリング基礎", "name": "ステージ4: フェース選択", 
-                    "description": "フェースを選択", "control": "3 キー", "manual": False},
-                5: {"title": "第3章: モデリング基礎", "name": "ステージ5: エクストルード", 
-                    "description": "E キーで押し出し", "control": "E キー", "manual": False},
-                6: {"title": "第3章: モデリング基礎", "name": "ステージ6: ループカット", 
-                    "description": "Ctrl+R でループカット", "control": "Ctrl+R", "manual": False},
-            }
-        elif chapter_num == 4:
-            stages = {
-                1: {"title": "第4章: スカルプティング体験", "name": "ステージ1: スカルプトモード", 
-                    "description": "Sculpt Mode に入ってください", "control": "", "manual": False},
-                2: {"title": "第4章: スカルプティング体験", "name": "ステージ2: Draw ブラシを使う", 
-                    "description": "Draw ブラシで球の表面を変形", "control": "Draw ブラシでドラッグ", "manual": False,
-                    "tip": "💡 ヒント: 自由に実験してみよう!"},
-                3: {"title": "第4章: スカルプティング体験", "name": "ステージ3: Smooth ブラシに切り替え", 
-                    "description": "Smooth ブラシを選択してください", "control": "Smooth ブラシを選択", "manual": False,
-                    "tip": "💡 ヒント: 自由に実験してみよう!"},
-                4: {"title": "第4章: スカルプティング体験", "name": "ステージ4: Grab ブラシに切り替え", 
-                    "description": "Grab ブラシを選択してください", "control": "Grab ブラシを選択", "manual": False,
-                    "tip": "💡 ヒント: 自由に実験してみよう!"},
-            }
-        elif chapter_num == 5:
-            stages = {
-                1: {"title": "第5章: マテリアルノード", "name": "🟢 ステージ1: マテリアル作成", 
-                    "description": "「新規」ボタンを押す",
-                    "details": "上部メニューの 「シェーディング」 を選択し,\n表示されたタブの 「新規」 ボタンを押してマテリアルを作成しよう!",
-                    "control": "", "manual": False},
-                2: {"title": "第5章: マテリアルノード", "name": "🟢 ステージ2: 色変更", 
-                    "description": "Base Color を変更",
-                    "details": "「プリンシプルBSDF」ノードの\nベースカラー を変更して,オブジェクトの色を変えてみよう!",
-                    "control": "", "manual": False},
-                3: {"title": "第5章: マテリアルノード", "name": "🟢 ステージ3: 画像テクスチャ追加", 
-                    "description": "追加 → 画像テクスチャで画像読み込み",
-                    "details": "メニューから\n\n追加 → テクスチャ → 画像テクスチャ\n\nを選択し,好きな画像を読み込んでみよう!",
-                    "control": "", "manual": False},
-                4: {"title": "第5章: マテリアルノード", "name": "🟢 ステージ4: ノード接続", 
-                    "description": "ImageTexture → BaseColor に接続",
-                    "details": "ImageTexture ノードの Color 出力を\nPrincipled BSDF のベースカラー入力に接続してみよう!",
-                    "control": "", "manual": False},
-                5: {"title": "第5章: マテリアルノード", "name": "🟢 ステージ5: 質感調整", 
-                    "description": "Roughness または Metallic を変更",
-                    "details": "Principled BSDF の\nラフネス または メタリック を変更して,\nリアルな素材の見た目を作ってみよう!",
-                    "control": "", "manual": False},
-            }
-        else:
-            return {}
-        
-        return stages.get(stage_num, {})
+        return _STAGE_INFO.get(chapter_num, {}).get(stage_num, {})
     
     @staticmethod
     def validate_stage(context):
         """Validate current stage and return (is_complete, message)"""
         try:
             props = context.scene.tutorial_props
-            current_chapter = props.current_chapter
-            current_stage = props.current_stage
-            obj = context.active_object
-            
-            if current_chapter == 1:
-                # ============ CHAPTER 1 ============
-                
-                if current_stage == 1:
-                    if obj and obj.name == "Cube":
-                        return True, "✓ キューブが選択されました"
-                    return False, "❌ キューブを選択してください"
-                
-                elif current_stage == 2:
-                    if obj and obj.name == "Cube":
-                        movement = obj.location.x - props.initial_position[0]
-                        if abs(movement - 2.0) < 0.1:
-                            return True, "✓ +2移動しました"
-                        return False, f"❌ 移動: {movement:.2f}"
-                    return False, "❌ キューブなし"
-                
-                elif current_stage == 3:
-                    if obj and obj.name == "Cube":
-                        rot = math.degrees(obj.rotation_euler.x) - math.degrees(props.initial_rotation[0])
-                        if abs(rot - 45.0) < 1.0:
-                            return True, "✓ 45度回転しました"
-                        return False, f"❌ 回転: {rot:.1f}°"
-                    return False, "❌ キューブなし"
-                
-                elif current_stage == 4:
-                    if obj and obj.name == "Cube":
-                        scale_changed = (abs(obj.scale.x - props.initial_scale[0]) > 0.01)
-                        if scale_changed:
-                            return True, "✓ スケール変更完了"
-                        return False, "❌ スケール値を変更してください"
-                    return False, "❌ キューブなし"
-            
-            elif current_chapter == 2:
-                # ============ CHAPTER 2 ============
-                
-                space = StageManager.get_view3d_space(context)
-                if not space or not space.region_3d:
-                    return False, "❌ 3Dビューなし"
-                
-                region_3d = space.region_3d
-                
-                if current_stage == 1:
-                    loc_diff = sum((region_3d.view_location[i] - props.initial_view_location[i])**2 
-                                  for i in range(3))**0.5
-                    if loc_diff > 0.1:
-                        return True, "✓ ビュー移動完了"
-                    return False, "❌ ビューをパンしてください"
-                
-                elif current_stage == 2:
-                    dist_diff = abs(region_3d.view_distance - props.initial_view_distance)
-                    if dist_diff > 0.5:
-                        return True, "✓ ズーム完了"
-                    return False, "❌ ズームしてください"
-                
-                elif current_stage == 3:
-                    loc_diff = sum((region_3d.view_location[i] - props.initial_view_location[i])**2 
-                                  for i in range(3))**0.5
-                    dist_diff = abs(region_3d.view_distance - props.initial_view_distance)
-                    if loc_diff > 0.01 or dist_diff > 0.01:
-                        return True, "✓ ビュー回転完了"
-                    return False, "❌ ビューを回転させてください"
-                
-                elif current_stage == 4:
-                    loc_diff = sum((region_3d.view_location[i] - props.initial_view_location[i])**2 
-                                  for i in range(3))**0.5
-                    dist_diff = abs(region_3d.view_distance - props.initial_view_distance)
-                    if loc_diff > 0.1 and dist_diff > 0.5:
-                        return True, "✓ すべてのビュー操作をマスターしました"
-                    return False, "❌ パン + ズームを実行してください"
-            
-            elif current_chapter == 3:
-                # ============ CHAPTER 3 ============
-                
-                if current_stage == 1:
-                    if obj and bpy.context.mode == 'EDIT_MESH':
-                        return True, "✓ エディットモード突入"
-                    return False, "❌ エディットモードに入ってください"
-                
-                elif current_stage == 2:
-                    bm = StageManager.get_bm(obj)
-                    if bm:
-                        sel_count = sum(1 for v in bm.verts if v.select)
-                        if sel_count >= 3:
-                            return True, f"✓ 頂点選択: {sel_count}個"
-                        return False, f"❌ 頂点を選択してください ({sel_count}個)"
-                    return False, "❌ エディットモード必須"
-                
-                elif current_stage == 3:
-                    bm = StageManager.get_bm(obj)
-                    if bm and any(e.select for e in bm.edges):
-                        return True, "✓ エッジ選択完了"
-                    return False, "❌ エッジを選択してください"
-                
-                elif current_stage == 4:
-                    bm = StageManager.get_bm(obj)
-                    if bm and any(f.select for f in bm.faces):
-                        return True, "✓ フェース選択完了"
-                    return False, "❌ フェースを選択してください"
-                
-                elif current_stage == 5:
-                    bm = StageManager.get_bm(obj)
-                    if bm and len(bm.faces) > props.initial_face_count:
-                        return True, f"✓ 押し出し完了: {props.initial_face_count}→{len(bm.faces)}"
-                    return False, "❌ 面を押し出してください"
-                
-                elif current_stage == 6:
-                    bm = StageManager.get_bm(obj)
-                    if bm and len(bm.verts) > props.initial_vertex_count:
-                        return True, f"✓ ループカット完了: {props.initial_vertex_count}��{len(bm.verts)}"
-                    return False, "❌ ループカットを追加してください"
-            
-            elif current_chapter == 4:
-                # ============ CHAPTER 4 ============
-                
-                sphere = StageManager.find_sphere()
-                
-                if current_stage == 1:
-                    if StageManager.is_in_sculpt_mode():
-                        if sphere:
-                            return True, "✓ スカルプトモード入場"
-                    return False, "❌ スカルプトモードに入ってください"
-                
-                elif current_stage == 2:
-                    if StageManager.is_in_sculpt_mode() and sphere:
-                        try:
-                            moved, total_dist = StageManager.get_vertex_deformation_amount(sphere, props.initial_vertex_positions)
-                            
-                            if moved > 5:
-                                return True, f"✓ Draw ブラシで変形: {moved}頂点"
-                            return False, f"❌ Draw ブラシで球を変形 ({moved}頂点)"
-                        except Exception as e:
-                            print(f"Error in stage 2: {e}")
-                            return False, f"❌ エラー: {str(e)}"
-                    return False, "❌ スカルプトモード必須"
-                
-                elif current_stage == 3:
-                    if StageManager.is_in_sculpt_mode():
-                        try:
-                            brush_name = StageManager.get_current_brush_name()
-                            if StageManager.is_brush_type_selected("Smooth"):
-                                return True, f"✓ Smooth ブラシを選択しました ({brush_name})"
-                            else:
-                                current_brush = brush_name if brush_name else "未選択"
-                                return False, f"❌ Smooth ブラシを選択してください (現在: {current_brush})"
-                        except Exception as e:
-                            print(f"Error in stage 3: {e}")
-                            return False, f"❌ エラー: {str(e)}"
-                    return False, "❌ スカルプトモード必須"
-                
-                elif current_stage == 4:
-                    if StageManager.is_in_sculpt_mode():
-                        try:
-                            brush_name = StageManager.get_current_brush_name()
-                            if StageManager.is_brush_type_selected("Grab"):
-                                return True, f"✓ Grab ブラシを選択しました ({brush_name})"
-                            else:
-                                current_brush = brush_name if brush_name else "未選択"
-                                return False, f"❌ Grab ブラシを選択してください (現在: {current_brush})"
-                        except Exception as e:
-                            print(f"Error in stage 4: {e}")
-                            return False, f"❌ エラー: {str(e)}"
-                    return False, "❌ スカルプトモード必須"
-            
-            elif current_chapter == 5:
-                # ============ CHAPTER 5: MATERIALS ============
-                
-                if current_stage == 1:
-                    # Stage 1: Material exists + use_nodes
-                    if obj:
-                        material = StageManager.get_active_material(obj)
-                        if material and material.use_nodes:
-                            return True, f"✓ マテリアル作成完了"
-                        return False, "❌ マテリアルを作成してください"
-                    return False, "❌ オブジェクトを選択してください"
-                
-                elif current_stage == 2:
-                    # Stage 2: BaseColor != default
-                    if obj:
-                        material = StageManager.get_active_material(obj)
-                        if material:
-                            bsdf = StageManager.get_principled_bsdf(material)
-                            if bsdf:
-                                try:
-                                    base_color = bsdf.inputs['Base Color'].default_value
-                                    default = (1.0, 1.0, 1.0, 1.0)
-                                    
-                                    changed = any(abs(base_color[i] - default[i]) > 0.01 for i in range(4))
-                                    
-                                    if changed:
-                                        return True, f"✓ ベースカラーを変更しました: RGB({base_color[0]:.2f}, {base_color[1]:.2f}, {base_color[2]:.2f})"
-                                    return False, "❌ Base Color を変更してください"
-                                except Exception as e:
-                                    print(f"Error getting base color: {e}")
-                                    return False, f"❌ エラー: {str(e)}"
-                            return False, "❌ Principled BSDF が見つかりません"
-                        return False, "❌ アクティブなマテリアルがありません"
-                    return False, "❌ オブジェクトを選択してください"
-                
-                elif current_stage == 3:
-                    # Stage 3: ImageTexture node with image
-                    if obj:
-                        if StageManager.check_image_texture_node_exists(obj):
-                            return True, f"✓ 画像テクスチャをロードしました"
-                        return False, "❌ Image Texture ノードに画像をロードしてください"
-                    return False, "❌ オブジェクトを選択してください"
-                
-                elif current_stage == 4:
-                    # Stage 4: Correct node link (ImageTexture Color -> BSDF BaseColor)
-                    if obj:
-                        if StageManager.check_correct_node_link(obj):
-                            return True, f"✓ ノードを正しく接続しました"
-                        return False, "❌ ImageTexture の Color を Principled BSDF の BaseColor に接続して��ださい"
-                    return False, "❌ オブジェクトを選択してください"
-                
-                elif current_stage == 5:
-                    # Stage 5: Roughness or Metallic changed
-                    if obj:
-                        material = StageManager.get_active_material(obj)
-                        if material:
-                            bsdf = StageManager.get_principled_bsdf(material)
-                            if bsdf:
-                                try:
-                                    roughness = bsdf.inputs['Roughness'].default_value
-                                    metallic = bsdf.inputs['Metallic'].default_value
-                                    
-                                    default_roughness = 0.5
-                                    default_metallic = 0.0
-                                    
-                                    roughness_changed = abs(roughness - default_roughness) > 0.01
-                                    metallic_changed = abs(metallic - default_metallic) > 0.01
-                                    
-                                    if roughness_changed or metallic_changed:
-                                        changed_params = []
-                                        if roughness_changed:
-                                            changed_params.append(f"Roughness: {roughness:.2f}")
-                                        if metallic_changed:
-                                            changed_params.append(f"Metallic: {metallic:.2f}")
-                                        
-                                        return True, f"✓ PBR パラメータを変更: {', '.join(changed_params)}"
-                                    return False, "❌ Roughness または Metallic を変更してください"
-                                except Exception as e:
-                                    print(f"Error getting PBR values: {e}")
-                                    return False, f"❌ エラー: {str(e)}"
-                            return False, "❌ Principled BSDF が見つかりません"
-                        return False, "❌ アクティブなマテリアルがありません"
-                    return False, "❌ オブジェクトを選択してください"
+            validator = _VALIDATORS.get((props.current_chapter, props.current_stage))
+            if validator is None:
+                return False, "\u274c \u5224\u5b9a\u30a8\u30e9\u30fc"
+            return validator(context, props, context.active_object)
         
         except Exception as e:
             print(f"Validation error: {e}")
-            import traceback
             traceback.print_exc()
-            return False, f"❌ エラー: {str(e)}"
-        
-        return False, "❌ 判定エラー"
+            return False, f"\u274c \u30a8\u30e9\u30fc: {str(e)}"
     
     @staticmethod
-    def check_stage(context):
+    def check_stage(context, props=None):
         """Check and advance stage based on current conditions"""
         try:
-            props = context.scene.tutorial_props
+            if props is None:
+                props = context.scene.tutorial_props
+            if props.stage_complete:
+                return  # nothing to do until the next stage resets the flag
+
             is_complete, _ = StageManager.validate_stage(context)
-            
-            if is_complete and not props.stage_complete:
+
+            if is_complete:
                 props.stage_complete = True
         except Exception as e:
             print(f"Stage check error: {e}")
 
+# =====================================================
+# STAGE VALIDATORS
+# =====================================================
+# One small function per (chapter, stage), dispatched through the
+# _VALIDATORS table below instead of a long if/elif cascade that had to
+# be re-walked on every monitoring tick. Each validator takes
+# (context, props, obj) and returns (is_complete, message).
+
+def _resolve_message(message):
+    """Resolve a validator message; messages may be zero-arg callables
+
+    The monitoring tick discards messages, so validators return a
+    callable for anything that would need f-string formatting and the
+    string is only built when an operator actually reports it.
+    """
+    return message() if callable(message) else message
+
+def _get_region_3d(context):
+    space = StageManager.get_view3d_space(context)
+    if space and space.region_3d:
+        return space.region_3d
+    return None
+
+# ---- Chapter 1: basic object operations ----
+
+def _validate_1_1(context, props, obj):
+    if obj and obj.name == "Cube":
+        return True, "✓ キューブが選択されました"
+    return False, "❌ キューブを選択してください"
+
+def _validate_1_2(context, props, obj):
+    if obj and obj.name == "Cube":
+        movement = obj.location.x - props.initial_position[0]
+        if abs(movement - 2.0) < 0.1:
+            return True, "✓ +2移動しました"
+        return False, lambda: f"❌ 移動: {movement:.2f}"
+    return False, "❌ キューブなし"
+
+def _validate_1_3(context, props, obj):
+    if obj and obj.name == "Cube":
+        rot = math.degrees(obj.rotation_euler.x) - math.degrees(props.initial_rotation[0])
+        if abs(rot - 45.0) < 1.0:
+            return True, "✓ 45度回転しました"
+        return False, lambda: f"❌ 回転: {rot:.1f}°"
+    return False, "❌ キューブなし"
+
+def _validate_1_4(context, props, obj):
+    if obj and obj.name == "Cube":
+        scale_changed = (abs(obj.scale.x - props.initial_scale[0]) > 0.01)
+        if scale_changed:
+            return True, "✓ スケール変更完了"
+        return False, "❌ スケール値を変更してください"
+    return False, "❌ キューブなし"
+
+# ---- Chapter 2: view navigation ----
+
+def _view_diffs(context, props):
+    """Squared pan distance and zoom delta against the stored initial view
+
+    Computed in one place so each stage check reads two floats instead
+    of re-deriving its own deltas. Returns (None, None) without a 3D view.
+    """
+    region_3d = _get_region_3d(context)
+    if not region_3d:
+        return None, None
+    loc_sq = (region_3d.view_location - Vector(props.initial_view_location)).length_squared
+    dist_diff = abs(region_3d.view_distance - props.initial_view_distance)
+    return loc_sq, dist_diff
+
+def _validate_2_1(context, props, obj):
+    loc_sq, _ = _view_diffs(context, props)
+    if loc_sq is None:
+        return False, "❌ 3Dビューなし"
+    if loc_sq > 0.01:  # 0.1 ** 2
+        return True, "✓ ビュー移動完了"
+    return False, "❌ ビューをパンしてください"
+
+def _validate_2_2(context, props, obj):
+    _, dist_diff = _view_diffs(context, props)
+    if dist_diff is None:
+        return False, "❌ 3Dビューなし"
+    if dist_diff > 0.5:
+        return True, "✓ ズーム完了"
+    return False, "❌ ズームしてください"
+
+def _validate_2_3(context, props, obj):
+    loc_sq, dist_diff = _view_diffs(context, props)
+    if loc_sq is None:
+        return False, "❌ 3Dビューなし"
+    if loc_sq > 1e-4 or dist_diff > 0.01:  # 0.01 ** 2
+        return True, "✓ ビュー回転完了"
+    return False, "❌ ビューを回転させてください"
+
+def _validate_2_4(context, props, obj):
+    loc_sq, dist_diff = _view_diffs(context, props)
+    if loc_sq is None:
+        return False, "❌ 3Dビューなし"
+    if loc_sq > 0.01 and dist_diff > 0.5:  # 0.1 ** 2
+        return True, "✓ すべてのビュー操作をマスターしました"
+    return False, "❌ パン + ズームを実行してください"
+
+# ---- Chapter 3: modeling basics ----
+
+def _validate_3_1(context, props, obj):
+    if obj and bpy.context.mode == 'EDIT_MESH':
+        return True, "✓ エディットモード突入"
+    return False, "❌ エディットモードに入ってください"
+
+def _in_edit_mesh(obj):
+    return obj and obj.type == 'MESH' and bpy.context.mode == 'EDIT_MESH'
+
+def _validate_3_2(context, props, obj):
+    if not _in_edit_mesh(obj):
+        return False, "❌ エディットモード必須"
+    # C-level selection totals instead of a Python loop over BMVerts
+    sel_verts, _, _ = obj.data.count_selected_items()
+    if sel_verts >= 3:
+        return True, lambda: f"✓ 頂点選択: {sel_verts}個"
+    return False, lambda: f"❌ 頂点を選択してください ({sel_verts}個)"
+
+def _validate_3_3(context, props, obj):
+    if not _in_edit_mesh(obj):
+        return False, "❌ エッジを選択してください"
+    _, sel_edges, _ = obj.data.count_selected_items()
+    if sel_edges > 0:
+        return True, "✓ エッジ選択完了"
+    return False, "❌ エッジを選択してください"
+
+def _validate_3_4(context, props, obj):
+    if not _in_edit_mesh(obj):
+        return False, "❌ フェースを選択してください"
+    _, _, sel_faces = obj.data.count_selected_items()
+    if sel_faces > 0:
+        return True, "✓ フェース選択完了"
+    return False, "❌ フェースを選択してください"
+
+def _validate_3_5(context, props, obj):
+    bm = StageManager.get_bm(obj)
+    if bm and len(bm.faces) > props.initial_face_count:
+        faces = len(bm.faces)
+        return True, lambda: f"✓ 押し出し完了: {props.initial_face_count}→{faces}"
+    return False, "❌ 面を押し出してください"
+
+def _validate_3_6(context, props, obj):
+    bm = StageManager.get_bm(obj)
+    if bm and len(bm.verts) > props.initial_vertex_count:
+        return True, f"✓ ループカット完了: {props.initial_vertex_count}��{len(bm.verts)}"
+    return False, "❌ ループカットを追加してください"
+
+# ---- Chapter 4: sculpting ----
+
+def _validate_4_1(context, props, obj):
+    if StageManager.is_in_sculpt_mode():
+        if StageManager.find_sphere():
+            return True, "✓ スカルプトモード入場"
+    return False, "❌ スカルプトモードに入ってください"
+
+def _validate_4_2(context, props, obj):
+    sphere = StageManager.find_sphere()
+    if StageManager.is_in_sculpt_mode() and sphere:
+        try:
+            moved, total_dist = StageManager.get_vertex_deformation_amount(sphere, props.initial_vertex_positions_blob)
+            
+            if moved > 5:
+                return True, lambda: f"✓ Draw ブラシで変形: {moved}頂点"
+            return False, lambda: f"❌ Draw ブラシで球を変形 ({moved}頂点)"
+        except Exception as e:
+            print(f"Error in stage 2: {e}")
+            return False, f"❌ エラー: {str(e)}"
+    return False, "❌ スカルプトモード必須"
+
+def _validate_4_3(context, props, obj):
+    if StageManager.is_in_sculpt_mode():
+        try:
+            if StageManager.is_brush_type_selected('SMOOTH'):
+                return True, lambda: f"✓ Smooth ブラシを選択しました ({StageManager.get_current_brush_name()})"
+            else:
+                return False, lambda: f"❌ Smooth ブラシを選択してください (現在: {StageManager.get_current_brush_name() or '未選択'})"
+        except Exception as e:
+            print(f"Error in stage 3: {e}")
+            return False, f"❌ エラー: {str(e)}"
+    return False, "❌ スカルプトモード必須"
+
+def _validate_4_4(context, props, obj):
+    if StageManager.is_in_sculpt_mode():
+        try:
+            if StageManager.is_brush_type_selected('GRAB'):
+                return True, lambda: f"✓ Grab ブラシを選択しました ({StageManager.get_current_brush_name()})"
+            else:
+                return False, lambda: f"❌ Grab ブラシを選択してください (現在: {StageManager.get_current_brush_name() or '未選択'})"
+        except Exception as e:
+            print(f"Error in stage 4: {e}")
+            return False, f"❌ エラー: {str(e)}"
+    return False, "❌ スカルプトモード必須"
+
+# ---- Chapter 5: material nodes ----
+
+def _validate_5_1(context, props, obj):
+    if obj:
+        material = StageManager.get_active_material(obj)
+        if material and material.use_nodes:
+            return True, f"✓ マテリアル作成完了"
+        return False, "❌ マテリアルを作成してください"
+    return False, "❌ オブジェクトを選択してください"
+
+def _validate_5_2(context, props, obj):
+    if obj:
+        material = StageManager.get_active_material(obj)
+        if material:
+            bsdf = StageManager.get_principled_bsdf(material)
+            if bsdf:
+                try:
+                    base_color = bsdf.inputs['Base Color'].default_value
+                    default = (1.0, 1.0, 1.0, 1.0)
+                    
+                    changed = any(abs(base_color[i] - default[i]) > 0.01 for i in range(4))
+                    
+                    if changed:
+                        return True, lambda: f"✓ ベースカラーを変更しました: RGB({base_color[0]:.2f}, {base_color[1]:.2f}, {base_color[2]:.2f})"
+                    return False, "❌ Base Color を変更してください"
+                except Exception as e:
+                    print(f"Error getting base color: {e}")
+                    return False, f"❌ エラー: {str(e)}"
+            return False, "❌ Principled BSDF が見つかりません"
+        return False, "❌ アクティブなマテリアルがありません"
+    return False, "❌ オブジェクトを選択してください"
+
+def _validate_5_3(context, props, obj):
+    if obj:
+        if StageManager.check_image_texture_node_exists(obj):
+            return True, f"✓ 画像テクスチャをロードしました"
+        return False, "❌ Image Texture ノードに画像をロードしてください"
+    return False, "❌ オブジェクトを選択してください"
+
+def _validate_5_4(context, props, obj):
+    if obj:
+        if StageManager.check_correct_node_link(obj):
+            return True, f"✓ ノードを正しく接続しました"
+        return False, "❌ ImageTexture の Color を Principled BSDF の BaseColor に接続して��ださい"
+    return False, "❌ オブジェクトを選択してください"
+
+def _validate_5_5(context, props, obj):
+    if obj:
+        material = StageManager.get_active_material(obj)
+        if material:
+            bsdf = StageManager.get_principled_bsdf(material)
+            if bsdf:
+                try:
+                    roughness = bsdf.inputs['Roughness'].default_value
+                    metallic = bsdf.inputs['Metallic'].default_value
+                    
+                    default_roughness = 0.5
+                    default_metallic = 0.0
+                    
+                    roughness_changed = abs(roughness - default_roughness) > 0.01
+                    metallic_changed = abs(metallic - default_metallic) > 0.01
+                    
+                    if roughness_changed or metallic_changed:
+                        def _pbr_message():
+                            changed_params = []
+                            if roughness_changed:
+                                changed_params.append(f"Roughness: {roughness:.2f}")
+                            if metallic_changed:
+                                changed_params.append(f"Metallic: {metallic:.2f}")
+                            return f"✓ PBR パラメータを変更: {', '.join(changed_params)}"
+                        
+                        return True, _pbr_message
+                    return False, "❌ Roughness または Metallic を変更してください"
+                except Exception as e:
+                    print(f"Error getting PBR values: {e}")
+                    return False, f"❌ エラー: {str(e)}"
+            return False, "❌ Principled BSDF が見つかりません"
+        return False, "❌ アクティブなマテリアルがありません"
+    return False, "❌ オブジェクトを選択してください"
+
+_VALIDATORS = {
+    (1, 1): _validate_1_1, (1, 2): _validate_1_2, (1, 3): _validate_1_3, (1, 4): _validate_1_4,
+    (2, 1): _validate_2_1, (2, 2): _validate_2_2, (2, 3): _validate_2_3, (2, 4): _validate_2_4,
+    (3, 1): _validate_3_1, (3, 2): _validate_3_2, (3, 3): _validate_3_3, (3, 4): _validate_3_4,
+    (3, 5): _validate_3_5, (3, 6): _validate_3_6,
+    (4, 1): _validate_4_1, (4, 2): _validate_4_2, (4, 3): _validate_4_3, (4, 4): _validate_4_4,
+    (5, 1): _validate_5_1, (5, 2): _validate_5_2, (5, 3): _validate_5_3, (5, 4): _validate_5_4,
+    (5, 5): _validate_5_5,
+}
+
 # =====================================================
 # PROPERTIES
 # =====================================================
 
+def _on_chapter_change(self, context):
+    """Entering a chapter always starts at stage 1 with a clean slate"""
+    # Direct id-property write so the stage update callback doesn't fire
+    # a second redundant reset
+    self["current_stage"] = 1
+    self.stage_complete = False
+    self.monitoring_active = False
+
+def _on_stage_change(self, context):
+    """Changing stage invalidates completion state and stops monitoring"""
+    self.stage_complete = False
+    self.monitoring_active = False
+
 class TUTORIAL_PG_Properties(PropertyGroup):
-    current_chapter: IntProperty(default=1, min=1, max=5)
-    current_stage: IntProperty(default=1, min=1, max=5)
+    current_chapter: IntProperty(default=1, min=1, max=5, update=_on_chapter_change)
+    current_stage: IntProperty(default=1, min=1, max=5, update=_on_stage_change)
     stage_complete: BoolProperty(default=False)
     monitoring_active: BoolProperty(default=False)
     
@@ -717,7 +854,11 @@ class TUTORIAL_PG_Properties(PropertyGroup):
     initial_edge_count: IntProperty(default=0)
     initial_face_count: IntProperty(default=0)
     
-    initial_vertex_positions: CollectionProperty(type=VertexPos)
+    initial_vertex_positions_blob: StringProperty(subtype='BYTE_STRING')
+    # Name of the mesh created by the setup operator; lets later
+    # chapters resolve it with an O(1) bpy.data.objects.get() instead
+    # of scanning every object in the file
+    active_mesh_name: StringProperty(default="")
     last_check_time: FloatProperty(default=0.0)
 
 # =====================================================
@@ -739,23 +880,22 @@ class TUTORIAL_OT_setup_stage(Operator):
             print(f"{'='*50}\n")
             
             if current_chapter == 1:
-                try:
-                    bpy.ops.object.select_all(action='SELECT')
-                    bpy.ops.object.delete(use_global=False)
-                except:
-                    pass
-                
+                StageManager.clear_scene_objects()
+
                 bpy.ops.mesh.primitive_cube_add(size=2, location=(0, 0, 0))
                 cube = bpy.context.active_object
                 cube.name = "Cube"
-                
+                props.active_mesh_name = cube.name
+
                 cube.location = (0.0, 0.0, 0.0)
                 cube.rotation_euler = (0.0, 0.0, 0.0)
                 cube.scale = (1.0, 1.0, 1.0)
                 
-                props.initial_position = tuple(cube.location)
-                props.initial_rotation = tuple(cube.rotation_euler)
-                props.initial_scale = tuple(cube.scale)
+                # Slicing returns a tuple straight from C, without
+                # Python-level iteration over the Vector/Euler
+                props.initial_position = cube.location[:]
+                props.initial_rotation = cube.rotation_euler[:]
+                props.initial_scale = cube.scale[:]
                 
                 print(f"✓ キューブ作成・リセット\n")
             
@@ -764,94 +904,55 @@ class TUTORIAL_OT_setup_stage(Operator):
                 if space and space.region_3d:
                     region_3d = space.region_3d
                     props.initial_view_distance = region_3d.view_distance
-                    props.initial_view_location = tuple(region_3d.view_location)
+                    props.initial_view_location = region_3d.view_location[:]
                     print(f"✓ ビュー初期状態を保存\n")
             
             elif current_chapter == 3:
                 cube = StageManager.find_cube()
                 if cube:
-                    try:
-                        if cube.mode == 'EDIT':
-                            bpy.ops.object.mode_set(mode='OBJECT')
-                    except:
-                        pass
-                    
-                    bpy.context.view_layer.objects.active = cube
-                    cube.select_set(True)
-                    
-                    bpy.ops.object.mode_set(mode='EDIT')
-                    bpy.context.view_layer.update()
-                    
-                    bm = bmesh.from_edit_mesh(cube.data)
-                    for v in bm.verts:
-                        v.select = False
-                    for e in bm.edges:
-                        e.select = False
-                    for f in bm.faces:
-                        f.select = False
-                    bmesh.update_edit_mesh(cube.data)
-                    
-                    verts, edges, faces = StageManager.get_mesh_element_count(cube)
-                    props.initial_vertex_count = verts
-                    props.initial_edge_count = edges
-                    props.initial_face_count = faces
-                    
-                    print(f"✓ メッシュ初期状態を保存・リセット\n")
-                    
-                    if current_stage == 6:
+                    if cube.mode == 'EDIT':
                         bpy.ops.object.mode_set(mode='OBJECT')
+
+                    if current_stage == 6:
+                        # Stage 6 starts from a fresh cube so the loop-cut
+                        # count comparison has a known baseline
+                        bpy.context.view_layer.objects.active = cube
+                        cube.select_set(True)
                         try:
                             bpy.ops.object.delete(use_global=False)
                         except:
                             pass
-                        
+
                         bpy.ops.mesh.primitive_cube_add(size=2, location=(0, 0, 0))
                         cube = bpy.context.active_object
                         cube.name = "Cube"
-                        bpy.ops.object.mode_set(mode='EDIT')
-                        bpy.context.view_layer.update()
-                        
-                        bm = bmesh.from_edit_mesh(cube.data)
-                        for v in bm.verts:
-                            v.select = False
-                        for e in bm.edges:
-                            e.select = False
-                        for f in bm.faces:
-                            f.select = False
-                        bmesh.update_edit_mesh(cube.data)
-                        
-                        verts, edges, faces = StageManager.get_mesh_element_count(cube)
-                        props.initial_vertex_count = verts
-                        props.initial_edge_count = edges
-                        props.initial_face_count = faces
-                        
+                        props.active_mesh_name = cube.name
+
+                        StageManager.enter_edit_and_snapshot(cube, props)
                         print(f"✓ Stage 6 メッシュをリセット\n")
+                    else:
+                        StageManager.enter_edit_and_snapshot(cube, props)
+                        print(f"✓ メッシュ初期状態を保存・リセット\n")
             
             elif current_chapter == 4:
-                try:
-                    bpy.ops.object.select_all(action='SELECT')
-                    bpy.ops.object.delete(use_global=False)
-                except:
-                    pass
-                
+                StageManager.clear_scene_objects()
+
                 bpy.ops.mesh.primitive_uv_sphere_add(radius=1.0, location=(0, 0, 0))
                 sphere = bpy.context.active_object
                 sphere.name = "Sphere"
+                props.active_mesh_name = sphere.name
                 
-                try:
-                    bpy.ops.object.mode_set(mode='SCULPT')
-                except:
+                if bpy.context.mode != 'SCULPT':
                     bpy.ops.object.mode_set(mode='SCULPT')
-                
-                bpy.context.view_layer.update()
-                
-                props.initial_vertex_positions.clear()
+
+                StageManager.clear_initial_positions_cache()
                 try:
-                    for v in sphere.data.vertices:
-                        item = props.initial_vertex_positions.add()
-                        item.co = v.co.copy()
-                except:
-                    pass
+                    verts = sphere.data.vertices
+                    arr = np.empty(len(verts) * 3, dtype=np.float32)
+                    verts.foreach_get('co', arr)
+                    props.initial_vertex_positions_blob = arr.tobytes()
+                except Exception as e:
+                    print(f"Error capturing vertex snapshot: {e}")
                 
                 verts, edges, faces = StageManager.get_mesh_element_count(sphere)
                 props.initial_vertex_count = verts
@@ -861,22 +962,26 @@ class TUTORIAL_OT_setup_stage(Operator):
             
             elif current_chapter == 5:
                 # Reset to object mode and select object
-                try:
+                if bpy.context.mode != 'OBJECT':
                     bpy.ops.object.mode_set(mode='OBJECT')
-                except:
-                    pass
-                
-                # Find or create a cube for materials
-                cube = None
-                for obj in bpy.data.objects:
-                    if obj.type == 'MESH':
-                        cube = obj
-                        break
                 
+                # Find or create a cube for materials; the name saved at
+                # creation time gives an O(1) lookup, the scan is only a
+                # fallback for scenes the addon didn't set up itself
+                cube = bpy.data.objects.get(props.active_mesh_name)
+                if not cube or cube.type != 'MESH':
+                    cube = None
+                    for obj in bpy.data.objects:
+                        if obj.type == 'MESH':
+                            cube = obj
+                            break
+
                 if not cube:
                     bpy.ops.mesh.primitive_cube_add(size=2, location=(0, 0, 0))
                     cube = bpy.context.active_object
                     cube.name = "Cube"
+
+                props.active_mesh_name = cube.name
                 
                 bpy.context.view_layer.objects.active = cube
                 cube.select_set(True)
@@ -897,7 +1002,6 @@ class TUTORIAL_OT_setup_stage(Operator):
         
         except Exception as e:
             print(f"Setup error: {e}")
-            import traceback
             traceback.print_exc()
             self.report({'ERROR'}, str(e))
             return {'CANCELLED'}
@@ -913,7 +1017,8 @@ class TUTORIAL_OT_validate_stage(Operator):
             current_stage = props.current_stage
             
             is_complete, message = StageManager.validate_stage(context)
-            
+            message = _resolve_message(message)
+
             print(f"\n{'='*50}")
             print(f"第{current_chapter}章 ステージ{current_stage}")
             print(f"{message}")
@@ -928,7 +1033,6 @@ class TUTORIAL_OT_validate_stage(Operator):
             return {'FINISHED'}
         except Exception as e:
             print(f"Validation error: {e}")
-            import traceback
             traceback.print_exc()
             self.report({'ERROR'}, f"エラー: {str(e)}")
             return {'CANCELLED'}
@@ -941,26 +1045,23 @@ class TUTORIAL_OT_next_stage(Operator):
         try:
             props = context.scene.tutorial_props
             
-            max_stages_per_chapter = {1: 4, 2: 4, 3: 6, 4: 4, 5: 5}
-            max_stages = max_stages_per_chapter.get(props.current_chapter, 4)
+            ch = props.current_chapter
+            max_stages = _MAX_STAGES[ch] if 1 <= ch <= 5 else 4
             
+            # The IntProperty update callbacks reset stage_complete and
+            # monitoring_active on assignment
             if props.current_stage < max_stages:
                 props.current_stage += 1
             elif props.current_chapter < 5:
                 props.current_chapter += 1
-                props.current_stage = 1
             else:
                 self.report({'INFO'}, "完了!")
                 return {'FINISHED'}
-            
-            props.stage_complete = False
-            props.monitoring_active = False
-            
+
             self.report({'INFO'}, f"第{props.current_chapter}章 ステージ{props.current_stage}")
             return {'FINISHED'}
         except Exception as e:
             print(f"Next stage error: {e}")
-            import traceback
             traceback.print_exc()
             self.report({'ERROR'}, f"エラー: {str(e)}")
             return {'CANCELLED'}
@@ -972,15 +1073,15 @@ class TUTORIAL_OT_reset(Operator):
     def execute(self, context):
         try:
             props = context.scene.tutorial_props
-            props.current_chapter = 1
-            props.current_stage = 1
-            props.stage_complete = False
-            props.monitoring_active = False
+            props.current_chapter = 1  # update callback resets stage and flags
+            # Drop the chapter-4 vertex snapshot so it doesn't linger
+            # in the saved .blend after a full reset
+            props.initial_vertex_positions_blob = b""
+            StageManager.clear_initial_positions_cache()
             self.report({'INFO'}, "リセット完了")
             return {'FINISHED'}
         except Exception as e:
             print(f"Reset error: {e}")
-            import traceback
             traceback.print_exc()
             self.report({'ERROR'}, f"エラー: {str(e)}")
             return {'CANCELLED'}
@@ -993,59 +1094,109 @@ class TUTORIAL_OT_goto_chapter(Operator):
     def execute(self, context):
         try:
             props = context.scene.tutorial_props
-            props.current_chapter = self.chapter
-            props.current_stage = 1
-            props.stage_complete = False
-            props.monitoring_active = False
+            props.current_chapter = self.chapter  # update callback resets stage and flags
             self.report({'INFO'}, f"第{self.chapter}章へ移動")
             return {'FINISHED'}
         except Exception as e:
             print(f"Goto chapter error: {e}")
-            import traceback
             traceback.print_exc()
             self.report({'ERROR'}, f"エラー: {str(e)}")
             return {'CANCELLED'}
 
+# Props reference cached across timer ticks so the callback does not
+# re-resolve the scene PointerProperty on every pass; dropped whenever
+# the timer unregisters and on file load.
+_monitor_props = None
+
+# Debounce timestamp for the depsgraph-driven validation
+_last_depsgraph_check = 0.0
+
+# Timestamp of the last monitor error print; a persistent failure in a
+# repeating callback must not spam (and stall) stdout on every tick
+_last_err_log = 0.0
+
+def _log_monitor_error(e):
+    """Rate-limited error reporting for the repeating monitor callbacks"""
+    global _last_err_log
+    now = time.monotonic()
+    if now - _last_err_log > 1.0:
+        _last_err_log = now
+        print(f"Monitoring error: {e}")
+        traceback.print_exc()
+
+@bpy.app.handlers.persistent
+def _on_depsgraph_update(scene, depsgraph):
+    """Event-driven validation: runs only when scene data changes
+
+    Edits are validated immediately (debounced to ~6 Hz) with zero
+    wakeups while the user is idle. View navigation never touches the
+    depsgraph, so the slow timer below stays as a fallback for the
+    chapter-2 stages.
+    """
+    global _last_depsgraph_check
+    try:
+        props = scene.tutorial_props
+        if not props.monitoring_active or props.stage_complete:
+            return
+
+        now = time.monotonic()
+        if now - _last_depsgraph_check < 0.15:
+            return
+        _last_depsgraph_check = now
+
+        if not StageManager.is_undo_running():
+            StageManager.check_stage(bpy.context, props)
+    except Exception as e:
+        _log_monitor_error(e)
+
+def _monitoring_tick():
+    """Fallback polling for changes the depsgraph never sees
+
+    The depsgraph handler above covers all object/mesh/material edits,
+    so this timer only needs to catch view navigation and can run
+    slowly. Returning None unregisters it once the stage is complete or
+    monitoring is switched off.
+    """
+    global _monitor_props
+    try:
+        props = _monitor_props
+        if props is None:
+            scene = bpy.context.scene
+            if scene is None:
+                return None
+            props = _monitor_props = scene.tutorial_props
+
+        if not props.monitoring_active:
+            _monitor_props = None
+            return None
+
+        if not StageManager.is_undo_running():
+            StageManager.check_stage(bpy.context, props)
+
+        if props.stage_complete:
+            _monitor_props = None
+            return None
+
+        return 0.5
+    except ReferenceError:
+        # Scene went away under the timer (new file, scene delete)
+        _monitor_props = None
+        return None
+    except Exception as e:
+        _log_monitor_error(e)
+        return 0.5
+
 class TUTORIAL_OT_monitoring(Operator):
     bl_idname = "wm.tutorial_monitoring"
     bl_label = "Tutorial Monitoring"
-    _timer = None
-    _last_check = 0.0
-    
-    def modal(self, context, event):
-        if event.type == 'TIMER':
-            try:
-                props = context.scene.tutorial_props
-                
-                if not props.monitoring_active:
-                    wm = context.window_manager
-                    if self._timer:
-                        wm.event_timer_remove(self._timer)
-                    return {'FINISHED'}
-                
-                if StageManager.is_undo_running():
-                    return {'PASS_THROUGH'}
-                
-                current_time = time.time()
-                if current_time - self._last_check > 0.2:
-                    StageManager.check_stage(context)
-                    self._last_check = current_time
-            
-            except Exception as e:
-                print(f"Modal error: {e}")
-        
-        return {'PASS_THROUGH'}
-    
+
     def execute(self, context):
         try:
-            wm = context.window_manager
-            self._timer = wm.event_timer_add(0.1, window=context.window)
-            self._last_check = time.time()
-            wm.modal_handler_add(self)
-            return {'RUNNING_MODAL'}
+            if not bpy.app.timers.is_registered(_monitoring_tick):
+                bpy.app.timers.register(_monitoring_tick, first_interval=0.5)
+            return {'FINISHED'}
         except Exception as e:
             print(f"Monitoring error: {e}")
-            import traceback
             traceback.print_exc()
             return {'CANCELLED'}
 
@@ -1059,18 +1210,37 @@ class TUTORIAL_PT_main(Panel):
     bl_space_type = 'VIEW_3D'
     bl_region_type = 'UI'
     bl_category = 'Tutorial'
-    
+
+    # Stage strings from the last draw; the layout must be re-emitted
+    # on every redraw, but these only change when (chapter, stage) does
+    _text_cache_key = None
+    _text_cache = None
+
     def draw(self, context):
         try:
             layout = self.layout
             props = context.scene.tutorial_props
-            
+
             ch = props.current_chapter
             st = props.current_stage
-            
-            max_stages_per_chapter = {1: 4, 2: 4, 3: 6, 4: 4, 5: 5}
-            max_stages = max_stages_per_chapter.get(ch, 4)
-            
+
+            cls = TUTORIAL_PT_main
+            if cls._text_cache_key != (ch, st):
+                info = StageManager.get_stage_info(ch, st)
+                max_stages = _MAX_STAGES[ch] if 1 <= ch <= 5 else 4
+                cls._text_cache = (
+                    info.get('title', ''),
+                    f"ステージ {st}/{max_stages}",
+                    info.get('name', ''),
+                    info.get('description', ''),
+                    _stage_details_lines(ch, st),
+                    f"操作: {info['control']}" if info.get('control', '') else '',
+                    info.get('tip', ''),
+                )
+                cls._text_cache_key = (ch, st)
+
+            title, stage_label, name, description, details_lines, control, tip = cls._text_cache
+
             # Chapter selection
             box = layout.box()
             box.label(text="チャプター選択")
@@ -1078,30 +1248,29 @@ class TUTORIAL_PT_main(Panel):
             for i in range(1, 6):
                 op = row.operator("tutorial.goto_chapter", text=f"第{i}章", depress=(ch == i))
                 op.chapter = i
-            
+
             # Stage info
-            info = StageManager.get_stage_info(ch, st)
             box = layout.box()
-            box.label(text=info.get('title', ''))
-            box.label(text=f"ステージ {st}/{max_stages}")
-            box.label(text=info.get('name', ''))
+            box.label(text=title)
+            box.label(text=stage_label)
+            box.label(text=name)
             box.separator()
-            box.label(text=info.get('description', ''))
-            
+            box.label(text=description)
+
             # Details field (for Chapter 5)
-            if info.get('details', ''):
+            if details_lines:
                 box.separator()
-                for line in info['details'].split('\n'):
+                for line in details_lines:
                     box.label(text=line)
-            
-            if info.get('control', ''):
+
+            if control:
                 box.separator()
-                box.label(text=f"操作: {info['control']}")
-            
+                box.label(text=control)
+
             # Tip
-            if info.get('tip', ''):
+            if tip:
                 box.separator()
-                box.label(text=info['tip'])
+                box.label(text=tip)
             
             # Status
             box.separator()
@@ -1132,15 +1301,23 @@ class TUTORIAL_PT_main(Panel):
         except Exception as e:
             layout = self.layout
             layout.label(text=f"エラー: {str(e)}")
-            import traceback
             traceback.print_exc()
 
 # =====================================================
 # REGISTER
 # =====================================================
 
+@bpy.app.handlers.persistent
+def _clear_caches_on_load(_dummy):
+    """Drop per-screen/per-mesh caches when a new file is loaded"""
+    global _initial_co_cache, _monitor_props
+    _monitor_props = None
+    _view3d_space_cache.clear()
+    _node_scan_cache.clear()
+    _edit_bm_cache.clear()
+    _initial_co_cache = None
+
 classes = (
-    VertexPos,
     TUTORIAL_PG_Properties,
     TUTORIAL_OT_setup_stage,
     TUTORIAL_OT_validate_stage,
@@ -1151,16 +1328,23 @@ classes = (
     TUTORIAL_PT_main,
 )
 
+# Factory pair avoids re-walking the tuple in Python per (un)register
+_register_classes, _unregister_classes = bpy.utils.register_classes_factory(classes)
+
 def register():
-    for cls in classes:
-        bpy.utils.register_class(cls)
+    _register_classes()
     bpy.types.Scene.tutorial_props = bpy.props.PointerProperty(type=TUTORIAL_PG_Properties)
+    bpy.app.handlers.load_post.append(_clear_caches_on_load)
+    bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update)
     print("✓ 3DCG Tutorial Simulator registered (Blender 4.2)")
 
 def unregister():
-    for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
+    _unregister_classes()
     del bpy.types.Scene.tutorial_props
+    if _clear_caches_on_load in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_clear_caches_on_load)
+    if _on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update)
     print("✓ 3DCG Tutorial Simulator unregistered")
 
 if __name__ == "__main__":